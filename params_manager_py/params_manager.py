@@ -21,9 +21,7 @@ May 15, 2025
 # limitations under the License.
 
 
-from typing import Any, List
-
-import yaml
+from typing import Any, Callable, List, Optional, Tuple
 
 from rclpy.node import Node
 from rclpy.parameter import Parameter
@@ -32,6 +30,97 @@ from rcl_interfaces.msg import IntegerRange, FloatingPointRange
 from rcl_interfaces.msg import ParameterDescriptor, ParameterType, SetParametersResult
 
 
+# Accepted boolean text representations
+_BOOL_MAP = {
+    'true': True,
+    'True': True,
+    'false': False,
+    'False': False
+}
+
+# Array types that rclpy reports as byte arrays when empty
+_ARRAY_TYPES = (
+    Parameter.Type.BOOL_ARRAY,
+    Parameter.Type.INTEGER_ARRAY,
+    Parameter.Type.DOUBLE_ARRAY,
+    Parameter.Type.STRING_ARRAY
+)
+
+
+def _as_bool(val: Any) -> bool:
+    """
+    Converts a YAML value to a boolean, reusing it if it already is one.
+
+    :param val: Value to convert, either a boolean or its text representation.
+    :return: Boolean value.
+    """
+    if val is True or val is False:
+        return val
+    try:
+        return _BOOL_MAP[val]
+    except (KeyError, TypeError):
+        raise ValueError(f"Unknown boolean text representation: {val}") from None
+
+
+def _as_str(val: Any) -> str:
+    """
+    Converts a YAML value to a string, reusing it if it already is one.
+
+    :param val: Value to convert.
+    :return: String value.
+    """
+    return val if type(val) is str else str(val)
+
+
+def _as_int(val: Any) -> int:
+    """
+    Converts a YAML value to an integer, reusing it if it already is one.
+
+    :param val: Value to convert.
+    :return: Integer value.
+    """
+    return val if type(val) is int else int(val)
+
+
+def _as_float(val: Any) -> float:
+    """
+    Converts a YAML value to a float, reusing it if it already is one.
+
+    :param val: Value to convert.
+    :return: Float value.
+    """
+    return val if type(val) is float else float(val)
+
+
+class _PData:
+    """
+    Stores the data of a managed parameter.
+    """
+
+    __slots__ = ('type', 'var_name', 'validator', 'validator_fn', 'has_var')
+
+    def __init__(
+        self,
+        type: Parameter.Type,
+        var_name: str,
+        validator: str,
+        validator_fn: Optional[Callable[[Parameter], bool]]
+    ) -> None:
+        """
+        Constructor.
+
+        :param type: Parameter type.
+        :param var_name: Associated node variable name.
+        :param validator: Associated node validator name.
+        :param validator_fn: Associated node validator routine, if already resolved.
+        """
+        self.type = type
+        self.var_name = var_name
+        self.validator = validator
+        self.validator_fn = validator_fn
+        self.has_var = var_name != ""
+
+
 class PManager:
     """
     Manages ROS 2 node parameters.
@@ -48,6 +137,19 @@ class PManager:
         self._params_data = {}
         self._verbose = verbose
 
+        # Build the YAML type dispatch table
+        # Each entry holds: declaration builder, value parser, array flag, range flag
+        self._builders = {
+            'integer': (self._build_integer_declaration, _as_int, False, True),
+            'double': (self._build_double_declaration, _as_float, False, True),
+            'bool': (self._build_bool_declaration, _as_bool, False, False),
+            'string': (self._build_string_declaration, _as_str, False, False),
+            'integer_array': (self._build_integer_array_declaration, _as_int, True, True),
+            'double_array': (self._build_double_array_declaration, _as_float, True, True),
+            'bool_array': (self._build_bool_array_declaration, _as_bool, True, False),
+            'string_array': (self._build_string_array_declaration, _as_str, True, False)
+        }
+
         # Register the parameter update callback
         self._node.add_on_set_parameters_callback(self._on_set_parameters_callback)
 
@@ -61,12 +163,7 @@ class PManager:
         if p.type_ == ParameterType.PARAMETER_STRING:
             msg += f"'{p.value}'"
         elif p.type_ == ParameterType.PARAMETER_STRING_ARRAY:
-            msg += "["
-            for i in range(len(p.value)):
-                msg += f"'{p.value[i]}'"
-                if i != (len(p.value) - 1):
-                    msg += ", "
-            msg += "]"
+            msg += "[" + ", ".join(f"'{s}'" for s in p.value) + "]"
         elif p.type_ == ParameterType.PARAMETER_BYTE_ARRAY:
             byte_array = p.value
             first_8 = byte_array[:8]
@@ -75,7 +172,7 @@ class PManager:
                 first_str = first_8.decode('ascii', errors='replace')
                 last_str = last_8.decode('ascii', errors='replace')
                 msg += f"['{first_str}' ... '{last_str}']"
-            except:
+            except (UnicodeDecodeError, AttributeError):
                 msg += f"['{list(first_8)}' ... '{list(last_8)}']"
         else:
             msg += f"{p.value}"
@@ -88,57 +185,50 @@ class PManager:
         :param params: List of parameters to update.
         :return: Parameter update operation result.
         """
-        # Initialize result object
-        res = SetParametersResult(
-            successful=True,
-            reason=''
-        )
+        logger = self._node.get_logger()
+
+        # Keep only the parameters managed by this object, with their data
+        params_data = self._params_data
+        managed = [
+            (p, p_data) for p in params
+            if (p_data := params_data.get(p.name)) is not None
+        ]
 
         # Check and update parameters
-        for p in params:
-
-            # Flag for special case: empty array treated as byte array by rclpy
-            special_case = False
-
-            # Check if the parameter is declared and get its data
-            p_data = self._params_data.get(p.name, None)
-            if p_data is None:
-                continue
-
-            # Check type for special case
-            if p.type_ == Parameter.Type.BYTE_ARRAY and len(p.value) == 0 and (
-                    Parameter.Type(p_data['type']) == Parameter.Type.BOOL_ARRAY or
-                    Parameter.Type(p_data['type']) == Parameter.Type.INTEGER_ARRAY or
-                    Parameter.Type(p_data['type']) == Parameter.Type.DOUBLE_ARRAY or
-                    Parameter.Type(p_data['type']) == Parameter.Type.STRING_ARRAY):
-                special_case = True
-
-            # Check type
-            if p.type_ != Parameter.Type(p_data['type']) and not special_case:
-                self._node.get_logger().error(
-                    f"Parameter '{p.name}' type mismatch")
-                res.successful = False
-                res.reason = f"Parameter '{p.name}' type mismatch"
-                return res
+        for (p, p_data) in managed:
+
+            # Check type, skipping the special case checks if it matches
+            p_type = p_data.type
+            if p.type_ != p_type and not (
+                    # Special case: empty array treated as byte array by rclpy
+                    p.type_ == Parameter.Type.BYTE_ARRAY and
+                    len(p.value) == 0 and
+                    p_type in _ARRAY_TYPES):
+                reason = f"Parameter '{p.name}' type mismatch"
+                logger.error(reason)
+                return SetParametersResult(successful=False, reason=reason)
 
             # Run validator, if present
-            validator = getattr(self._node, p_data['validator'], None)
-            if validator is not None and callable(validator) and not validator(p):
-                self._node.get_logger().error(
-                    f"Parameter '{p.name}' update validation failed")
-                res.successful = False
-                res.reason = f"Parameter '{p.name}' update validation failed"
-                return res
+            # Look it up on the node if it could not be resolved at declaration time
+            validator = p_data.validator_fn
+            if validator is None and p_data.validator != "":
+                validator = getattr(self._node, p_data.validator, None)
+                if not callable(validator):
+                    validator = None
+            if validator is not None and not validator(p):
+                reason = f"Parameter '{p.name}' update validation failed"
+                logger.error(reason)
+                return SetParametersResult(successful=False, reason=reason)
 
             # Update variable, if present
-            if 'var_name' in p_data and p_data['var_name'] != "":
-                setattr(self._node, p_data['var_name'], p.value)
+            if p_data.has_var:
+                setattr(self._node, p_data.var_name, p.value)
 
             # Log update
             if (self._verbose):
                 self._log_update(p)
 
-        return res
+        return SetParametersResult(successful=True, reason='')
 
     def _add_to_data(
         self,
@@ -150,61 +240,45 @@ class PManager:
         """
         Adds a new set of parameter data to the dictionary.
 
+        The validator is bound when the parameter is declared, so replacing it on
+        the node afterwards has no effect; validators that do not exist yet as
+        callable node attributes are instead looked up upon each update.
+
         :param name: Parameter name.
         :param type: Parameter type.
         :param var_name: Associated node variable name.
         :param validator: Associated node validator name.
         """
-        param_data = {}
-        param_data['type'] = type
-        param_data['var_name'] = var_name
-        param_data['validator'] = validator
-        self._params_data[name] = param_data
-
-    def _parse_bool_str(self, word: str) -> bool:
-        """
-        Parses a boolean encoded as a string.
+        # Resolve the validator routine once, so that updates can call it directly
+        validator_fn = getattr(self._node, validator, None) if validator != "" else None
+        if validator_fn is not None and not callable(validator_fn):
+            validator_fn = None
 
-        :param word: Word to parse.
-        :return: Boolean value.
-        """
-        if word == 'true' or word == 'True':
-            return True
-        elif word == 'false' or word == 'False':
-            return False
-        else:
-            raise ValueError(f"Unknown boolean text representation: {word}")
+        self._params_data[name] = _PData(
+            Parameter.Type(type),
+            var_name,
+            validator,
+            validator_fn
+        )
 
-    def _declare_bool_parameter(
+    def _build_bool_declaration(
         self,
         name: str,
         default_val: bool,
         desc: str,
         constraints: str,
-        read_only: bool,
-        var_name: str,
-        validator: str
-    ) -> None:
+        read_only: bool
+    ) -> Tuple[str, Any, ParameterDescriptor]:
         """
-        Declares a bool parameter.
+        Builds the declaration of a bool parameter.
 
         :param name: Parameter name.
         :param default_val: Parameter default value.
         :param desc: Parameter description.
         :param constraints: Parameter additional constraints.
         :param read_only: Parameter read only flag.
-        :param var_name: Associated node variable name.
-        :param validator: Associated node validator name.
+        :return: Parameter name, default value, and descriptor.
         """
-        # Add parameter to the internal database
-        self._add_to_data(
-            name,
-            ParameterType.PARAMETER_BOOL,
-            var_name,
-            validator
-        )
-
-        # Declare parameter
         descriptor = ParameterDescriptor(
             name=name,
             type=ParameterType.PARAMETER_BOOL,
@@ -213,38 +287,26 @@ class PManager:
             read_only=read_only,
             dynamic_typing=False
         )
-        self._node.declare_parameter(name, default_val, descriptor)
+        return (name, default_val, descriptor)
 
-    def _declare_bool_array_parameter(
+    def _build_bool_array_declaration(
         self,
         name: str,
         default_val: List[bool],
         desc: str,
         constraints: str,
-        read_only: bool,
-        var_name: str,
-        validator: str
-    ) -> None:
+        read_only: bool
+    ) -> Tuple[str, Any, ParameterDescriptor]:
         """
-        Declares a bool array parameter.
+        Builds the declaration of a bool array parameter.
 
         :param name: Parameter name.
         :param default_val: Parameter default value.
         :param desc: Parameter description.
         :param constraints: Parameter additional constraints.
         :param read_only: Parameter read only flag.
-        :param var_name: Associated node variable name.
-        :param validator: Associated node validator name.
+        :return: Parameter name, default value, and descriptor.
         """
-        # Add parameter to the internal database
-        self._add_to_data(
-            name,
-            ParameterType.PARAMETER_BOOL_ARRAY,
-            var_name,
-            validator
-        )
-
-        # Declare parameter
         descriptor = ParameterDescriptor(
             name=name,
             type=ParameterType.PARAMETER_BOOL_ARRAY,
@@ -256,9 +318,9 @@ class PManager:
         if len(default_val) == 0:
             # Fix for empty array treated as byte array by rclpy
             descriptor.dynamic_typing = True
-        self._node.declare_parameter(name, default_val, descriptor)
+        return (name, default_val, descriptor)
 
-    def _declare_integer_parameter(
+    def _build_integer_declaration(
         self,
         name: str,
         default_val: int,
@@ -267,12 +329,10 @@ class PManager:
         step: int,
         desc: str,
         constraints: str,
-        read_only: bool,
-        var_name: str,
-        validator: str
-    ) -> None:
+        read_only: bool
+    ) -> Tuple[str, Any, ParameterDescriptor]:
         """
-        Declares an integer parameter.
+        Builds the declaration of an integer parameter.
 
         :param name: Parameter name.
         :param default_val: Parameter default value.
@@ -282,18 +342,8 @@ class PManager:
         :param desc: Parameter description.
         :param constraints: Parameter additional constraints.
         :param read_only: Parameter read only flag.
-        :param var_name: Associated node variable name.
-        :param validator: Associated node validator name.
+        :return: Parameter name, default value, and descriptor.
         """
-        # Add parameter to the internal database
-        self._add_to_data(
-            name,
-            ParameterType.PARAMETER_INTEGER,
-            var_name,
-            validator
-        )
-
-        # Declare parameter
         range = IntegerRange(
             from_value=from_val,
             to_value=to_val,
@@ -308,9 +358,9 @@ class PManager:
             dynamic_typing=False,
             integer_range=[range]
         )
-        self._node.declare_parameter(name, default_val, descriptor)
+        return (name, default_val, descriptor)
 
-    def _declare_integer_array_parameter(
+    def _build_integer_array_declaration(
         self,
         name: str,
         default_val: List[int],
@@ -319,12 +369,10 @@ class PManager:
         step: int,
         desc: str,
         constraints: str,
-        read_only: bool,
-        var_name: str,
-        validator: str
-    ) -> None:
+        read_only: bool
+    ) -> Tuple[str, Any, ParameterDescriptor]:
         """
-        Declares an integer array parameter.
+        Builds the declaration of an integer array parameter.
 
         :param name: Parameter name.
         :param default_val: Parameter default value.
@@ -334,18 +382,8 @@ class PManager:
         :param desc: Parameter description.
         :param constraints: Parameter additional constraints.
         :param read_only: Parameter read only flag.
-        :param var_name: Associated node variable name.
-        :param validator: Associated node validator name.
+        :return: Parameter name, default value, and descriptor.
         """
-        # Add parameter to the internal database
-        self._add_to_data(
-            name,
-            ParameterType.PARAMETER_INTEGER_ARRAY,
-            var_name,
-            validator
-        )
-
-        # Declare parameter
         range = IntegerRange(
             from_value=from_val,
             to_value=to_val,
@@ -363,9 +401,9 @@ class PManager:
         if len(default_val) == 0:
             # Fix for empty array treated as byte array by rclpy
             descriptor.dynamic_typing = True
-        self._node.declare_parameter(name, default_val, descriptor)
+        return (name, default_val, descriptor)
 
-    def _declare_double_parameter(
+    def _build_double_declaration(
         self,
         name: str,
         default_val: float,
@@ -374,12 +412,10 @@ class PManager:
         step: float,
         desc: str,
         constraints: str,
-        read_only: bool,
-        var_name: str,
-        validator: str
-    ) -> None:
+        read_only: bool
+    ) -> Tuple[str, Any, ParameterDescriptor]:
         """
-        Declares a double parameter.
+        Builds the declaration of a double parameter.
 
         :param name: Parameter name.
         :param default_val: Parameter default value.
@@ -389,18 +425,8 @@ class PManager:
         :param desc: Parameter description.
         :param constraints: Parameter additional constraints.
         :param read_only: Parameter read only flag.
-        :param var_name: Associated node variable name.
-        :param validator: Associated node validator name.
+        :return: Parameter name, default value, and descriptor.
         """
-        # Add parameter to the internal database
-        self._add_to_data(
-            name,
-            ParameterType.PARAMETER_DOUBLE,
-            var_name,
-            validator
-        )
-
-        # Declare parameter
         range = FloatingPointRange(
             from_value=from_val,
             to_value=to_val,
@@ -415,9 +441,9 @@ class PManager:
             dynamic_typing=False,
             floating_point_range=[range]
         )
-        self._node.declare_parameter(name, default_val, descriptor)
+        return (name, default_val, descriptor)
 
-    def _declare_double_array_parameter(
+    def _build_double_array_declaration(
         self,
         name: str,
         default_val: List[float],
@@ -426,12 +452,10 @@ class PManager:
         step: float,
         desc: str,
         constraints: str,
-        read_only: bool,
-        var_name: str,
-        validator: str
-    ) -> None:
+        read_only: bool
+    ) -> Tuple[str, Any, ParameterDescriptor]:
         """
-        Declares a double array parameter.
+        Builds the declaration of a double array parameter.
 
         :param name: Parameter name.
         :param default_val: Parameter default value.
@@ -441,18 +465,8 @@ class PManager:
         :param desc: Parameter description.
         :param constraints: Parameter additional constraints.
         :param read_only: Parameter read only flag.
-        :param var_name: Associated node variable name.
-        :param validator: Associated node validator name.
+        :return: Parameter name, default value, and descriptor.
         """
-        # Add parameter to the internal database
-        self._add_to_data(
-            name,
-            ParameterType.PARAMETER_DOUBLE_ARRAY,
-            var_name,
-            validator
-        )
-
-        # Declare parameter
         range = FloatingPointRange(
             from_value=from_val,
             to_value=to_val,
@@ -470,38 +484,26 @@ class PManager:
         if len(default_val) == 0:
             # Fix for empty array treated as byte array by rclpy
             descriptor.dynamic_typing = True
-        self._node.declare_parameter(name, default_val, descriptor)
+        return (name, default_val, descriptor)
 
-    def _declare_string_parameter(
+    def _build_string_declaration(
         self,
         name: str,
         default_val: str,
         desc: str,
         constraints: str,
-        read_only: bool,
-        var_name: str,
-        validator: str
-    ) -> None:
+        read_only: bool
+    ) -> Tuple[str, Any, ParameterDescriptor]:
         """
-        Declares a string parameter.
+        Builds the declaration of a string parameter.
 
         :param name: Parameter name.
         :param default_val: Parameter default value.
         :param desc: Parameter description.
         :param constraints: Parameter additional constraints.
         :param read_only: Parameter read only flag.
-        :param var_name: Associated node variable name.
-        :param validator: Associated node validator name.
+        :return: Parameter name, default value, and descriptor.
         """
-        # Add parameter to the internal database
-        self._add_to_data(
-            name,
-            ParameterType.PARAMETER_STRING,
-            var_name,
-            validator
-        )
-
-        # Declare parameter
         descriptor = ParameterDescriptor(
             name=name,
             type=ParameterType.PARAMETER_STRING,
@@ -510,38 +512,26 @@ class PManager:
             read_only=read_only,
             dynamic_typing=False
         )
-        self._node.declare_parameter(name, default_val, descriptor)
+        return (name, default_val, descriptor)
 
-    def _declare_string_array_parameter(
+    def _build_string_array_declaration(
         self,
         name: str,
         default_val: List[str],
         desc: str,
         constraints: str,
-        read_only: bool,
-        var_name: str,
-        validator: str
-    ) -> None:
+        read_only: bool
+    ) -> Tuple[str, Any, ParameterDescriptor]:
         """
-        Declares a string array parameter.
+        Builds the declaration of a string array parameter.
 
         :param name: Parameter name.
         :param default_val: Parameter default value.
         :param desc: Parameter description.
         :param constraints: Parameter additional constraints.
         :param read_only: Parameter read only flag.
-        :param var_name: Associated node variable name.
-        :param validator: Associated node validator name.
+        :return: Parameter name, default value, and descriptor.
         """
-        # Add parameter to the internal database
-        self._add_to_data(
-            name,
-            ParameterType.PARAMETER_STRING_ARRAY,
-            var_name,
-            validator
-        )
-
-        # Declare parameter
         descriptor = ParameterDescriptor(
             name=name,
             type=ParameterType.PARAMETER_STRING_ARRAY,
@@ -553,7 +543,7 @@ class PManager:
         if len(default_val) == 0:
             # Fix for empty array treated as byte array by rclpy
             descriptor.dynamic_typing = True
-        self._node.declare_parameter(name, default_val, descriptor)
+        return (name, default_val, descriptor)
 
     def declare_byte_array_parameter(
         self,
@@ -601,10 +591,18 @@ class PManager:
 
         :param params_file: Full path of the parameters configuration YAML file.
         """
+        # Import the YAML parser only when a parameters file must be parsed
+        import yaml
+        try:
+            from yaml import CSafeLoader as YAMLLoader
+        except ImportError:
+            from yaml import SafeLoader as YAMLLoader
+
         # Start by parsing the YAML contents into a Python object
+        # The file is opened in binary mode to let the loader decode it
         try:
-            with open(params_file, "r") as f:
-                params_yaml = yaml.load(f, Loader=yaml.SafeLoader)
+            with open(params_file, "rb") as f:
+                params_yaml = yaml.load(f, Loader=YAMLLoader)
         except FileNotFoundError:
             self._node.get_logger().fatal(f"Parameters file not found: {params_file}")
             raise RuntimeError(
@@ -624,122 +622,72 @@ class PManager:
             raise RuntimeError(
                 f"Invalid parameters file: {params_file}")
 
-        # Get ordered params dictionary and declare the parameters
+        # Nothing to declare if no parameters are configured
+        params = params_yaml['params']
+        if not params:
+            return
+
+        # Iterate over the parameters in name order and declare them
         # This highly depends on the parameter type and YAML parsing
-        params_dict = dict(sorted(params_yaml['params'].items()))
-        for (param_name, values) in params_dict.items():
-            try:
-                if values['type'] == 'integer':
-                    self._declare_integer_parameter(
-                        param_name,
-                        int(values['default_value']),
-                        int(values['min_value']),
-                        int(values['max_value']),
-                        int(values['step']),
-                        str(values['description']),
-                        str(values['constraints']),
-                        self._parse_bool_str(str(values['read_only'])),
-                        str(values.get('var_name', '')),
-                        str(values.get('validator', ''))
-                    )
-                elif values['type'] == 'double':
-                    self._declare_double_parameter(
-                        param_name,
-                        float(values['default_value']),
-                        float(values['min_value']),
-                        float(values['max_value']),
-                        float(values['step']),
-                        str(values['description']),
-                        str(values['constraints']),
-                        self._parse_bool_str(str(values['read_only'])),
-                        str(values.get('var_name', '')),
-                        str(values.get('validator', ''))
-                    )
-                elif values['type'] == 'bool':
-                    self._declare_bool_parameter(
-                        param_name,
-                        self._parse_bool_str(str(values['default_value'])),
-                        str(values['description']),
-                        str(values['constraints']),
-                        self._parse_bool_str(str(values['read_only'])),
-                        str(values.get('var_name', '')),
-                        str(values.get('validator', ''))
-                    )
-                elif values['type'] == 'string':
-                    self._declare_string_parameter(
-                        param_name,
-                        str(values['default_value']),
-                        str(values['description']),
-                        str(values['constraints']),
-                        self._parse_bool_str(str(values['read_only'])),
-                        str(values.get('var_name', '')),
-                        str(values.get('validator', ''))
-                    )
-                elif values['type'] == 'integer_array':
-                    default_values = []
-                    for val in list(values['default_value']):
-                        default_values.append(int(val))
-                    self._declare_integer_array_parameter(
-                        param_name,
-                        default_values,
-                        int(values['min_value']),
-                        int(values['max_value']),
-                        int(values['step']),
-                        str(values['description']),
-                        str(values['constraints']),
-                        self._parse_bool_str(str(values['read_only'])),
-                        str(values.get('var_name', '')),
-                        str(values.get('validator', ''))
-                    )
-                elif values['type'] == 'double_array':
-                    default_values = []
-                    for val in list(values['default_value']):
-                        default_values.append(float(val))
-                    self._declare_double_array_parameter(
-                        param_name,
-                        default_values,
-                        float(values['min_value']),
-                        float(values['max_value']),
-                        float(values['step']),
-                        str(values['description']),
-                        str(values['constraints']),
-                        self._parse_bool_str(str(values['read_only'])),
-                        str(values.get('var_name', '')),
-                        str(values.get('validator', ''))
-                    )
-                elif values['type'] == 'bool_array':
-                    default_values = []
-                    for val in list(values['default_value']):
-                        default_values.append(self._parse_bool_str(str(val)))
-                    self._declare_bool_array_parameter(
-                        param_name,
-                        default_values,
-                        str(values['description']),
-                        str(values['constraints']),
-                        self._parse_bool_str(str(values['read_only'])),
-                        str(values.get('var_name', '')),
-                        str(values.get('validator', ''))
-                    )
-                elif values['type'] == 'string_array':
-                    default_values = []
-                    for val in list(values['default_value']):
-                        default_values.append(str(val))
-                    self._declare_string_array_parameter(
-                        param_name,
-                        default_values,
-                        str(values['description']),
-                        str(values['constraints']),
-                        self._parse_bool_str(str(values['read_only'])),
-                        str(values.get('var_name', '')),
-                        str(values.get('validator', ''))
-                    )
-                else:
+        params_items = sorted(params.items())
+        declarations = []
+        registrations = []
+        builders = self._builders
+        try:
+            for (param_name, values) in params_items:
+                builder = builders.get(values['type'])
+                if builder is None:
                     raise ValueError(
                         f"Unsupported parameter type: {values['type']}")
+                build_fn, parse_fn, is_array, has_range = builder
+
+                if is_array:
+                    default_val = [parse_fn(val) for val in values['default_value']]
+                else:
+                    default_val = parse_fn(values['default_value'])
+                if has_range:
+                    range_args = (
+                        parse_fn(values['min_value']),
+                        parse_fn(values['max_value']),
+                        parse_fn(values['step'])
+                    )
+                else:
+                    range_args = ()
+
+                declaration = build_fn(
+                    param_name,
+                    default_val,
+                    *range_args,
+                    _as_str(values['description']),
+                    _as_str(values['constraints']),
+                    _as_bool(values['read_only'])
+                )
+                declarations.append(declaration)
+                registrations.append((
+                    param_name,
+                    declaration[2].type,
+                    _as_str(values.get('var_name', '')),
+                    _as_str(values.get('validator', ''))
+                ))
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to parse configuration of parameter {param_name}: {e}") from e
+
+        # Add parameters to the internal database
+        # This must precede the declaration, which runs the update callback
+        for registration in registrations:
+            self._add_to_data(*registration)
 
-            except Exception as e:
-                raise RuntimeError(
-                    f"Failed to parse configuration of parameter {param_name}: {e}")
+        # Declare all the parameters
+        try:
+            self._node.declare_parameters('', declarations)
+        except Exception as e:
+            # Drop the data of the parameters that could not be declared
+            for registration in registrations:
+                if not self._node.has_parameter(registration[0]):
+                    del self._params_data[registration[0]]
+            raise RuntimeError(
+                f"Failed to declare parameters from {params_file}: {e}") from e
 
     def init(self) -> None:
         """